@@ -1,7 +1,11 @@
 import logging
 import os
+import shutil
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError
+from urllib3.util.retry import Retry
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -9,32 +13,55 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 SCRAPE_URL = "https://docs.scroll.io/en/developers/scroll-contracts/"  # Replace with the actual URL to scrape
 OUTPUT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "scRape"))
 OUTPUT_HTML_FILE = os.path.join(OUTPUT_DIR, "scroll-contract-addresses.html")
+USER_AGENT = "py_helpers-scraper/0.1"
+CHUNK_SIZE = 1 << 16
 
+# shared session so repeated fetches reuse the keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.5))
+)
+_SESSION.headers.update({"User-Agent": USER_AGENT})
 
-def fetch_html(url):
+
+def fetch_html(url, output_file):
+    # stream the raw bytes to disk; decoding is left to the parser in step 2
     try:
-        response = requests.get(url)
-        response.raise_for_status()
+        with _SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            save_html(response.raw, output_file)
         logging.info(f"Successfully fetched HTML from '{url}'.")
-        return response.text
-    except requests.RequestException as e:
+        return True
+    except (requests.RequestException, HTTPError) as e:
         print(f"Error fetching the URL '{url}': {e}")
-        return None
+        return False
 
 
-def save_html(html_content, output_file):
+def save_html(html_stream, output_file):
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # stream beside the target and swap it in, so a dropped transfer can't replace
+    # the previous capture with a truncated page
+    tmp_file = output_file + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            shutil.copyfileobj(html_stream, f, length=CHUNK_SIZE)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except FileNotFoundError:
+            pass
+        raise
     logging.info(f"Saved HTML content to '{output_file}'.")
 
 
 def main():
-    html_content = fetch_html(SCRAPE_URL)
-    if html_content:
-        save_html(html_content, OUTPUT_HTML_FILE)
-    else:
-        logging.error("Failed to fetch HTML content. Exiting.")
+    try:
+        if not fetch_html(SCRAPE_URL, OUTPUT_HTML_FILE):
+            logging.error("Failed to fetch HTML content. Exiting.")
+    finally:
+        _SESSION.close()
 
 
 if __name__ == "__main__":
@@ -2,36 +2,61 @@ import json
 import os
 import re
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SC_RAPE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "scRape"))
 OUTPUT_BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "constants"))
 
+# Regular expression to match Ethereum addresses
+ETH_ADDRESS_RE = re.compile(r"0x[a-fA-F0-9]{40}", re.ASCII)
+
+# Step 1 saves the server's raw bytes. Pages that declare a charset (or start with a BOM)
+# are left to libxml2; undeclared ones are read as utf-8 instead of libxml2's latin-1 default
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+DECLARED_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+CHARSET_SNIFF_BYTES = 4096
+BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+
+# Compiled XPath expressions for walking contract tables
+HEADER_XPATH = etree.XPath("./thead//th")
+ROW_XPATH = etree.XPath("./tbody/tr")
+CELL_XPATH = etree.XPath("./td")
+CODE_XPATH = etree.XPath(".//code")
+
 
 def extract_contracts(html_content):
     # Parse the HTML content
-    soup = BeautifulSoup(html_content, "lxml")
+    head = html_content[:CHARSET_SNIFF_BYTES]
+    if head.startswith(BOMS) or DECLARED_CHARSET_RE.search(head):
+        tree = lxml.html.fromstring(html_content)
+    else:
+        tree = lxml.html.fromstring(html_content, parser=UTF8_HTML_PARSER)
     contracts = []
-    # Regular expression to match Ethereum addresses
-    eth_address_regex = re.compile(r"^0x[a-fA-F0-9]{40}$")
+    is_eth_address = ETH_ADDRESS_RE.fullmatch
     # Find all tables in the HTML
-    tables = soup.find_all("table")
-    for table in tables:
-        headers = [th.text.strip() for th in table.find("thead").find_all("th")]
+    for table in tree.iter("table"):
+        headers = [th.text_content().strip() for th in HEADER_XPATH(table)]
         try:
             name_idx = headers.index("Name")
             address_idx = headers.index("Address")
         except ValueError:
             # Skip tables without 'Name' and 'Address' columns
             continue
-        rows = table.find("tbody").find_all("tr")
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) >= max(name_idx, address_idx) + 1:
-                name = cols[name_idx].text.strip()
-                address_tag = cols[address_idx].find("code")
-                address = address_tag.text.strip() if address_tag else cols[address_idx].text.strip()
-                if eth_address_regex.match(address):
+        min_cols = max(name_idx, address_idx) + 1
+        for row in ROW_XPATH(table):
+            cols = CELL_XPATH(row)
+            if len(cols) >= min_cols:
+                name = cols[name_idx].text_content().strip()
+                address_cell = cols[address_idx]
+                address_tags = CODE_XPATH(address_cell)
+                address = (address_tags[0] if address_tags else address_cell).text_content().strip()
+                if is_eth_address(address):
                     contracts.append({"name": name, "address": address})
     return contracts
 
@@ -41,8 +66,12 @@ def save_contracts(contracts, output_dir, json_filename):
     os.makedirs(output_dir, exist_ok=True)
     contracts_data = {contract["name"]: contract["address"] for contract in contracts}
     output_file = os.path.join(output_dir, json_filename)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(contracts_data, f, indent=4)
+    if orjson is not None:
+        encoded = orjson.dumps(contracts_data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(contracts_data, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(output_file, "wb") as f:
+        f.write(encoded)
     print(f"Saved {len(contracts)} contract addresses to '{output_file}'.")
 
 
@@ -52,20 +81,17 @@ def main():
         print(f"Error: scrape directory does not exist at '{SC_RAPE_DIR}'")
         return
     # Find all .html files in scRape directory
-    html_files = [f for f in os.listdir(SC_RAPE_DIR) if f.lower().endswith(".html")]
-    if not html_files:
+    with os.scandir(SC_RAPE_DIR) as it:
+        html_entries = [e for e in it if e.name.lower().endswith(".html") and e.is_file()]
+    if not html_entries:
         print(f"No .html files found in '{SC_RAPE_DIR}'")
         return
-    for html_file in html_files:
-        html_path = os.path.join(SC_RAPE_DIR, html_file)
+    for entry in html_entries:
+        html_path = entry.path
         print(f"\nProcessing file: '{html_path}'")
-        # Check if the input file exists
-        if not os.path.isfile(html_path):
-            print(f"Error: input file does not exist at '{html_path}'")
-            continue
         try:
-            # Read the HTML content
-            with open(html_path, "r", encoding="utf-8") as f:
+            # Read the raw HTML bytes; lxml decodes them while parsing
+            with open(html_path, "rb") as f:
                 html_content = f.read()
             # Extract contracts
             contracts = extract_contracts(html_content)
@@ -73,7 +99,7 @@ def main():
                 print(f"No valid contract addresses found in '{html_path}'.")
                 continue
             # Dynamically name the output directory based on the HTML file name
-            base_name = os.path.splitext(html_file)[0]
+            base_name = os.path.splitext(entry.name)[0]
             output_dir = os.path.join(OUTPUT_BASE_DIR, base_name)
             # Define the JSON filename
             json_filename = f"{base_name}.json"
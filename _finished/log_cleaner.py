@@ -7,14 +7,26 @@ DEFAULT_EXTENSIONS = [".log", ".json", ".txt", ".csv", ".html"]
 
 
 def clean_logs(directories: List[str], extensions: List[str]) -> List[Tuple[str, int]]:
+    suffixes = tuple(ext.lower() for ext in extensions)
     results = []
     for directory in directories:
         count = 0
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if any(file.endswith(ext) for ext in extensions):
-                    os.remove(os.path.join(root, file))
-                    count += 1
+        stack = [directory]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes):
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            continue
+                        count += 1
         results.append((directory, count))
     return results
 
@@ -1,7 +1,16 @@
+import asyncio
 import os
+import shelve
+import time
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
+
+USER_AGENT = "py_helpers-doc_enjoyoor/0.1"
+MAX_CONCURRENCY = 16
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+PYPI_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "doc_enjoyoor", "pypi")
+PYPI_CACHE_TTL = 24 * 60 * 60  # seconds
 
 
 def get_package_names(requirements_path):
@@ -17,13 +26,7 @@ def get_package_names(requirements_path):
     return packages
 
 
-def get_github_repo(package):
-    url = f"https://pypi.org/pypi/{package}/json"
-    response = requests.get(url)
-    if response.status_code != 200:
-        print(f"Failed to fetch data for package: {package}")
-        return None
-    data = response.json()
+def extract_github_repo(data):
     project_urls = data.get("info", {}).get("project_urls")
 
     # ensure project_urls is a dictionary
@@ -43,20 +46,38 @@ def get_github_repo(package):
     return None
 
 
-def fetch_readme(repo_url):
+async def fetch_github_repo(session, package, cache):
+    # requirements rarely change, so reuse the repo URL resolved on a previous run
+    cache_key = package.lower()
+    cached = cache.get(cache_key)
+    if cached is not None and time.time() - cached[0] < PYPI_CACHE_TTL:
+        return cached[1]
+
+    url = f"https://pypi.org/pypi/{package}/json"
+    async with session.get(url) as response:
+        if response.status != 200:
+            print(f"Failed to fetch data for package: {package}")
+            return None
+        data = await response.json()
+    repo_url = extract_github_repo(data)
+    cache[cache_key] = (time.time(), repo_url)
+    return repo_url
+
+
+async def fetch_readme(session, repo_url):
     parsed_url = urlparse(repo_url)
     path_parts = parsed_url.path.strip("/").split("/")
     if len(path_parts) < 2:
         return None
     owner, repo = path_parts[:2]
-    api_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/README.md"
-    response = requests.get(api_url)
-    if response.status_code == 404:
-        # try master branch
-        api_url = f"https://raw.githubusercontent.com/{owner}/{repo}/master/README.md"
-        response = requests.get(api_url)
-    if response.status_code == 200:
-        return response.text
+    # try main first, then fall back to master
+    for branch in ("main", "master"):
+        api_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md"
+        async with session.get(api_url) as response:
+            if response.status == 200:
+                return await response.text()
+            if response.status != 404:
+                break
     print(f"README.md not found for repository: {repo_url}")
     return None
 
@@ -69,7 +90,23 @@ def save_readme(package, content, docs_dir):
     print(f"Saved README for {package} to {filepath}")
 
 
-def main():
+async def process_package(session, semaphore, cache, package, docs_dir):
+    async with semaphore:
+        print(f"Processing package: {package}")
+        try:
+            repo_url = await fetch_github_repo(session, package, cache)
+            if not repo_url:
+                print(f"GitHub repository not found for package: {package}")
+                return
+            readme_content = await fetch_readme(session, repo_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error processing package {package}: {e}")
+            return
+    if readme_content:
+        save_readme(package, readme_content, docs_dir)
+
+
+async def main():
     repo_root = os.getcwd()
     requirements_path = os.path.join(repo_root, "requirements.txt")
     if not os.path.exists(requirements_path):
@@ -82,16 +119,21 @@ def main():
     packages = get_package_names(requirements_path)
     print(f"Found {len(packages)} packages in requirements.txt.")
 
-    for package in packages:
-        print(f"Processing package: {package}")
-        repo_url = get_github_repo(package)
-        if not repo_url:
-            print(f"GitHub repository not found for package: {package}")
-            continue
-        readme_content = fetch_readme(repo_url)
-        if readme_content:
-            save_readme(package, readme_content, docs_dir)
+    # pypi and github lookups are pure network I/O, so overlap them across packages
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY)
+    os.makedirs(os.path.dirname(PYPI_CACHE_PATH), exist_ok=True)
+    with shelve.open(PYPI_CACHE_PATH) as cache:
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT}
+        ) as session:
+            await asyncio.gather(
+                *(
+                    process_package(session, semaphore, cache, package, docs_dir)
+                    for package in packages
+                )
+            )
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,6 +1,9 @@
 import fnmatch
 import os
+import re
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 ROOT_DIR = "XYZ:/Users/"  # root directory to start the search
 PATTERN = "*.txt"  # file pattern to search for
@@ -8,29 +11,40 @@ NUM_WORKERS = 4  # number of worker threads
 MAX_DEPTH = None  # maximum depth to search (None for no limit)
 
 
+@lru_cache(maxsize=None)
+def compile_pattern(pattern):
+    """
+    translate the glob pattern to a regex matcher once instead of per file
+    """
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
 def find_files(directory, pattern, max_depth=None):
     """
-    recursively find files matching the pattern in the given directory
+    iteratively find files matching the pattern in the given directory
     """
     matches = []
-    current_depth = 0
+    is_match = compile_pattern(pattern)
+    pending = deque([(directory, 0)])
 
-    def search_directory(current_dir, current_depth):
-        nonlocal matches
+    while pending:
+        current_dir, current_depth = pending.pop()
 
         if max_depth is not None and current_depth > max_depth:
-            return
+            continue
 
         try:
-            for entry in os.scandir(current_dir):
-                if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                    matches.append(entry.path)
-                elif entry.is_dir():
-                    search_directory(entry.path, current_depth + 1)
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if is_match(entry.name):
+                            matches.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False) and not entry.is_junction():
+                        pending.append((entry.path, current_depth + 1))
         except PermissionError:
             print(f"permission denied: {current_dir}")
 
-    search_directory(directory, current_depth)
     return matches
 
 
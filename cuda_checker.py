@@ -1,14 +1,27 @@
+import os
+import shutil
 import subprocess
 import sys
 
 
-def run_command(command):
-    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
+def run_command(argv):
+    try:
+        result = subprocess.run(argv, capture_output=True, text=True, check=False)
+    except OSError as e:
+        return "", str(e)
     return result.stdout, result.stderr
 
 
+def find_on_path(filename):
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        candidate = os.path.join(directory, filename)
+        if directory and os.path.isfile(candidate):
+            return candidate
+    return None
+
+
 print("Checking CUDA installation:")
-stdout, stderr = run_command("nvcc --version")
+stdout, stderr = run_command([shutil.which("nvcc") or "nvcc", "--version"])
 if stdout:
     print(stdout)
 else:
@@ -16,12 +29,11 @@ else:
     print("Error:", stderr)
 
 print("\nChecking cuDNN:")
-stdout, stderr = run_command("where cudnn64_8.dll")
-if stdout:
-    print("cuDNN found:", stdout)
+cudnn_path = find_on_path("cudnn64_8.dll")
+if cudnn_path:
+    print("cuDNN found:", cudnn_path)
 else:
     print("cuDNN not found in PATH.")
-    print("Error:", stderr)
 
 print("\nPython executable:")
 print(sys.executable)
@@ -1,5 +1,6 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 
 def get_cache_dirs():
@@ -11,15 +12,34 @@ def get_cache_dirs():
         os.path.join(home, ".cache", "diffusers"),  # Diffusers cache
         os.path.join(home, ".huggingface"),  # Alternative Hugging Face cache
     ]
-    return list(set(cache_dirs))  # Remove duplicates
+    return list(dict.fromkeys(cache_dirs))  # Remove duplicates, keep order
+
+
+def get_dir_size(path):
+    # iterative scandir walk; DirEntry.stat reuses the data gathered while listing
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    try:
+                        total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+    return total
 
 
 def print_cache_sizes(cache_dirs):
     for directory in cache_dirs:
         if os.path.exists(directory):
-            size = sum(
-                os.path.getsize(os.path.join(dirpath, filename)) for dirpath, dirnames, filenames in os.walk(directory) for filename in filenames
-            )
+            size = get_dir_size(directory)
             print(f"Cache directory: {directory}")
             print(f"Size: {size / (1024 * 1024):.2f} MB")
         else:
@@ -27,14 +47,50 @@ def print_cache_sizes(cache_dirs):
         print()
 
 
+def remove_tree(directory):
+    # model caches hold many independent snapshot dirs, so delete the top level in parallel
+    errors = []
+
+    def on_error(func, path, exc):
+        errors.append(f"{path}: {exc}")
+
+    def remove_entry(entry):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, onexc=on_error)
+        else:
+            try:
+                os.unlink(entry.path)
+            except OSError as e:
+                on_error(os.unlink, entry.path, e)
+
+    # scandir would follow a relocated cache's symlink and empty its target;
+    # refuse like shutil.rmtree does
+    if os.path.islink(directory):
+        raise OSError("Cannot call rmtree on a symbolic link")
+
+    with os.scandir(directory) as it:
+        entries = list(it)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(remove_entry, entries))
+    if not errors:
+        os.rmdir(directory)
+    return errors
+
+
 def clear_cache(cache_dirs):
     for directory in cache_dirs:
         if os.path.exists(directory):
             try:
-                shutil.rmtree(directory)
-                print(f"Cleared cache directory: {directory}")
+                errors = remove_tree(directory)
             except Exception as e:
                 print(f"Error clearing {directory}: {e}")
+                continue
+            if errors:
+                print(f"Error clearing {directory}: {len(errors)} path(s) could not be removed")
+                for error in errors[:10]:
+                    print(f"  {error}")
+            else:
+                print(f"Cleared cache directory: {directory}")
         else:
             print(f"Cache directory does not exist: {directory}")
 
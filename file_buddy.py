@@ -1,25 +1,57 @@
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+from json_injectoor import has_lossy_floats
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_bytes(data):
+    if orjson is not None:
+        try:
+            parsed = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict (no NaN/Infinity), let the stdlib parser have a go
+            pass
+        else:
+            # integers beyond 64 bits come back as floats; reparse those exactly
+            if not has_lossy_floats(parsed):
+                return parsed
+    return json.loads(data)
+
+
+def dump_json_bytes(data):
+    # orjson writes NaN/Infinity as null, so leave those to the stdlib
+    if orjson is not None and not has_lossy_floats(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def json_to_txt(input_path, output_path):
-    with open(input_path, "r") as json_file:
-        data = json.load(json_file)
+    with open(input_path, "rb") as json_file:
+        data = load_json_bytes(json_file.read())
 
-    with open(output_path, "w") as txt_file:
-        txt_file.write(json.dumps(data, indent=2))
+    with open(output_path, "wb") as txt_file:
+        txt_file.write(dump_json_bytes(data))
 
     print(f"Converted {input_path} to {output_path}")
 
 
 def txt_to_json(input_path, output_path):
-    with open(input_path, "r") as txt_file:
+    with open(input_path, "rb") as txt_file:
         data = txt_file.read()
 
     try:
-        json_data = json.loads(data)
-        with open(output_path, "w") as json_file:
-            json.dump(json_data, json_file, indent=2)
+        json_data = load_json_bytes(data)
+        with open(output_path, "wb") as json_file:
+            json_file.write(dump_json_bytes(json_data))
         print(f"Converted {input_path} to {output_path}")
     except json.JSONDecodeError:
         print(f"Error: {input_path} does not contain valid JSON data. Skipping conversion.")
@@ -37,14 +69,37 @@ def convert_file(input_path, output_path):
         print(f"Unsupported conversion: {input_ext} to {output_ext}")
 
 
+def iter_files(directory):
+    stack = [directory]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def convert_group(input_paths):
+    for input_path in input_paths:
+        output_ext = ".txt" if input_path.endswith(".json") else ".json"
+        output_path = os.path.splitext(input_path)[0] + output_ext
+        convert_file(input_path, output_path)
+
+
 def process_directory(directory):
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith((".json", ".txt")):
-                input_path = os.path.join(root, file)
-                output_ext = ".txt" if file.endswith(".json") else ".json"
-                output_path = os.path.splitext(input_path)[0] + output_ext
-                convert_file(input_path, output_path)
+    # x.json and x.txt write each other, so keep such pairs in one serial task
+    groups = {}
+    for path in iter_files(directory):
+        if path.endswith((".json", ".txt")):
+            groups.setdefault(os.path.splitext(path)[0], []).append(path)
+
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(convert_group, groups.values(), chunksize=16))
 
 
 if __name__ == "__main__":
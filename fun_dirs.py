@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 emoji_map = {
@@ -25,21 +26,26 @@ emoji_map = {
     "world-chain-contract-address": "🌐",
 }
 
+DEFAULT_EMOJI = "📄"
+INDENTS = tuple("   " * i for i in range(128))
+
 
 def get_emoji(name):
-    return emoji_map.get(name, "📄")  # Default to 📄 for unknown files/folders
+    return emoji_map.get(name, DEFAULT_EMOJI)  # Default to 📄 for unknown files/folders
 
 
 def print_directory_structure(startpath, level=0):
+    get = emoji_map.get
     for root, dirs, files in os.walk(startpath):
         if ".git" in dirs:
             dirs.remove(".git")  # Don't show git directory
-        path = Path(root)
-        print("   " * level + f"{get_emoji(path.name)} {path.name}")
-        level += 1
-        for file in files:
-            print("   " * level + f"{get_emoji(file)} {file}")
-        level -= 1
+        name = Path(root).name
+        indent = INDENTS[level]
+        file_indent = INDENTS[level + 1]
+        lines = [f"{indent}{get(name, DEFAULT_EMOJI)} {name}"]
+        lines.extend(f"{file_indent}{get(file, DEFAULT_EMOJI)} {file}" for file in files)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
         if level == 0:
             break  # Only process the top-level directory
 
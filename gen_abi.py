@@ -1,13 +1,22 @@
+import argparse
+import asyncio
 import json
+import mmap
 import os
-import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load .env file
 load_dotenv()
 
@@ -98,6 +107,43 @@ MINIMAL_ABIS = {
 }
 
 
+def loads_json(data):
+    """Parse JSON from str/bytes, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, 2-space indented when requested"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def load_json_file(filepath: Path):
+    """Parse a JSON file straight from a read-only memory map (no heap copy with orjson)"""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads_json(b"")  # mmap can't map empty files; let the parser raise
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is None:
+                return json.loads(mm[:])
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def write_bytes_atomic(filepath: Path, blob: bytes) -> None:
+    """Write to a sibling temp file and rename it over the target in one step"""
+    tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+    tmp_path.write_bytes(blob)
+    os.replace(tmp_path, filepath)
+
+
+# MINIMAL_ABIS never change at runtime, so serialize them once at import
+MINIMAL_ABIS_BYTES = {name: dumps_json(abi, indent=True) for name, abi in MINIMAL_ABIS.items()}
+
+
 class ABIGenerator:
     def __init__(self):
         self.setup_constants()
@@ -105,10 +151,31 @@ class ABIGenerator:
 
     def setup_constants(self):
         """Initialize constants and configurations"""
-        self.ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
-        self.ETHERSCAN_API = "https://api.etherscan.io/api"
+        self.ETHERSCAN_API_KEY = ETHERSCAN_API_KEY
+        self.ETHERSCAN_API = ETHERSCAN_API
         self.OUTPUT_DIR = Path("abi")
         self.BACKUP_DIR = self.OUTPUT_DIR / "backups"
+        self.CACHE_DIR = self.OUTPUT_DIR / ".cache"
+        self._abi_cache = {}
+
+        # Etherscan free tier allows 5 requests per second
+        self.MAX_CONCURRENCY = 5
+        self.MIN_REQUEST_INTERVAL = 0.2
+        self.REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+        # Retry policy for transient failures only
+        self.MAX_RETRIES = 3
+        self.RETRY_BACKOFF = 2
+        self.RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+        self.USER_AGENT = "py_helpers-gen_abi/0.1"
+        self._next_request_at = 0.0
+
+        # Query parameters shared by every getabi request
+        self.BASE_PARAMS = {
+            "module": "contract",
+            "action": "getabi",
+            "apikey": self.ETHERSCAN_API_KEY,
+        }
 
         # Network configurations
         self.NETWORKS = {
@@ -136,65 +203,175 @@ class ABIGenerator:
         self.OUTPUT_DIR.mkdir(exist_ok=True)
         self.BACKUP_DIR.mkdir(exist_ok=True)
 
+    async def wait_for_rate_limit(self):
+        """Space requests MIN_REQUEST_INTERVAL apart across all pending fetches"""
+        now = asyncio.get_running_loop().time()
+        wait_time = self._next_request_at - now
+        self._next_request_at = max(now, self._next_request_at) + self.MIN_REQUEST_INTERVAL
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
     def backup_existing_abis(self):
         """Backup existing ABI files"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = self.BACKUP_DIR / timestamp
 
-        if list(self.OUTPUT_DIR.glob("*.json")):
-            backup_dir.mkdir(exist_ok=True)
-            for file in self.OUTPUT_DIR.glob("*.json"):
-                if file.parent != self.BACKUP_DIR:
-                    backup_path = backup_dir / file.name
-                    backup_path.write_text(file.read_text())
-            print(f"✅ Backed up existing ABIs to {backup_dir}")
+        # single directory scan; backups/ and .cache/ are directories and never match
+        with os.scandir(self.OUTPUT_DIR) as entries:
+            files = [e for e in entries if e.name.endswith(".json") and e.is_file()]
+        if not files:
+            return
+
+        backup_dir.mkdir(exist_ok=True)
+        # copyfile skips the str decode/encode and uses sendfile where available
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda e: shutil.copyfile(e.path, backup_dir / e.name), files))
+        print(f"✅ Backed up existing ABIs to {backup_dir}")
 
-    def fetch_abi_from_etherscan(self, contract_address: str, network: str = "mainnet") -> Optional[List]:
+    async def fetch_abi_from_etherscan(
+        self, session: aiohttp.ClientSession, contract_address: str, network: str = "mainnet"
+    ) -> Optional[List]:
         """Fetch full ABI from Etherscan with rate limiting and retries"""
         if not self.ETHERSCAN_API_KEY:
             print("⚠️  No Etherscan API key provided. Skipping fetch.")
             return None
 
         api_url = self.NETWORKS.get(network, self.NETWORKS["mainnet"])
-        params = {
-            "module": "contract",
-            "action": "getabi",
-            "address": contract_address,
-            "apikey": self.ETHERSCAN_API_KEY
-        }
+        params = {**self.BASE_PARAMS, "address": contract_address}
 
-        max_retries = 3
-        for attempt in range(max_retries):
+        for attempt in range(self.MAX_RETRIES):
             try:
-                response = requests.get(api_url, params=params)
-                response.raise_for_status()
-                data = response.json()
+                await self.wait_for_rate_limit()
+                async with session.get(api_url, params=params) as response:
+                    if response.status in self.RETRY_STATUSES:
+                        error = f"HTTP {response.status}"
+                    else:
+                        response.raise_for_status()
+                        data = loads_json(await response.read())
+                        error = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+            except (aiohttp.ClientError, ValueError) as e:
+                # Non-transient failures (4xx, malformed body) are not worth retrying
+                print(f"❌ Error fetching ABI for {contract_address}: {str(e)}")
+                return None
 
-                if data["status"] == "1" and data["message"] == "OK":
-                    return json.loads(data["result"])
-                else:
-                    print(f"⚠️  Error fetching ABI: {data['message']}")
+            if error is None:
+                try:
+                    if data.get("status") == "1" and data.get("message") == "OK":
+                        return loads_json(data["result"])
+                    message = data.get("message")
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    # Non-dict body, or an OK reply whose result isn't an ABI JSON string
+                    print(f"❌ Malformed Etherscan reply for {contract_address}: {e!r}")
                     return None
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    print(
-                        f"⚠️  Attempt {attempt + 1} failed, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
+                print(f"⚠️  Error fetching ABI: {message}")
+                return None
+
+            if attempt < self.MAX_RETRIES - 1:
+                wait_time = self.RETRY_BACKOFF * 2 ** attempt  # Exponential backoff
+                print(f"⚠️  Attempt {attempt + 1} failed ({error}), retrying in {wait_time}s...")
+                await asyncio.sleep(wait_time)
+            else:
+                print(f"❌ Error fetching ABI for {contract_address}: {error}")
+        return None
+
+    def abi_cache_path(self, contract_address: str, network: str) -> Path:
+        """Location of the on-disk cache entry for a contract ABI"""
+        return self.CACHE_DIR / network / f"{contract_address.lower()}.json"
+
+    async def get_abi(
+        self,
+        session: aiohttp.ClientSession,
+        contract_address: str,
+        network: str = "mainnet",
+        force: bool = False,
+    ) -> Optional[List]:
+        """Return a contract ABI from the memory/disk cache, fetching it on a miss"""
+        key = (network, contract_address.lower())
+        cache_path = self.abi_cache_path(contract_address, network)
+        if not force:
+            if key in self._abi_cache:
+                return self._abi_cache[key]
+            if cache_path.is_file():
+                try:
+                    abi = load_json_file(cache_path)
+                except ValueError as e:
+                    # A corrupt or empty entry is just a miss; drop it and fetch again
+                    print(f"⚠️  Discarding unreadable cache entry {cache_path}: {e}")
+                    cache_path.unlink(missing_ok=True)
                 else:
-                    print(
-                        f"❌ Error fetching ABI for {contract_address}: {str(e)}")
-                    return None
+                    self._abi_cache[key] = abi
+                    return abi
+
+        abi = await self.fetch_abi_from_etherscan(session, contract_address, network)
+        if abi is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(cache_path, dumps_json(abi))
+            self._abi_cache[key] = abi
+        return abi
+
+    async def fetch_full_abis(self, network: str = "mainnet", force: bool = False):
+        """Fetch every contract ABI concurrently over one pooled session"""
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.REQUEST_TIMEOUT,
+            headers={"User-Agent": self.USER_AGENT},
+        ) as session:
+            pending = []
+            for category, contracts in self.CONTRACTS.items():
+                print(f"\n📂 Category: {category}")
+                for name, address in contracts.items():
+                    print(f"⏳ Fetching {name}...")
+                    pending.append((name, address))
+            abis = await self.fetch_abis_batch(
+                session, [address for _, address in pending], network, force
+            )
+        for name, address in pending:
+            abi = abis.get(address.lower())
+            if abi:
+                self.save_abi(f"{name}_full", abi)
+
+    async def fetch_abis_batch(
+        self,
+        session: aiohttp.ClientSession,
+        addresses: List[str],
+        network: str = "mainnet",
+        force: bool = False,
+    ) -> dict:
+        """Fetch ABIs for many addresses, requesting each distinct contract only once"""
+        # getabi only accepts one address, so dedupe and fan out over the shared session
+        unique = list(dict.fromkeys(address.lower() for address in addresses))
+        results = await asyncio.gather(
+            *(self.get_abi(session, address, network, force) for address in unique),
+            return_exceptions=True,
+        )
+        # One bad contract shouldn't throw away every ABI fetched alongside it
+        abis = {}
+        for address, result in zip(unique, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error fetching ABI for {address}: {result!r}")
+                result = None
+            abis[address] = result
+        return abis
+
+    def load_abi(self, name: str) -> List:
+        """Load a previously saved ABI by name"""
+        return load_json_file(self.OUTPUT_DIR / f"{name}.json")
 
     def save_abi(self, name: str, abi: List) -> None:
         """Save ABI to a JSON file with pretty formatting"""
+        self.save_abi_bytes(name, dumps_json(abi, indent=True))
+
+    def save_abi_bytes(self, name: str, blob: bytes) -> None:
+        """Write an already serialized ABI to its JSON file"""
         filepath = self.OUTPUT_DIR / f"{name}.json"
 
-        with open(filepath, "w") as f:
-            json.dump(abi, f, indent=2)
+        write_bytes_atomic(filepath, blob)
         print(f"✅ Created {filepath}")
 
-    def generate_abis(self, fetch_full: bool = True, network: str = "mainnet"):
+    def generate_abis(self, fetch_full: bool = True, network: str = "mainnet", force: bool = False):
         """Main ABI generation process"""
         print("\n🚀 Starting ABI generation process...")
 
@@ -203,34 +380,43 @@ class ABIGenerator:
 
         # Save minimal ABIs
         print("\n📝 Generating minimal ABIs...")
-        for name, abi in MINIMAL_ABIS.items():
-            self.save_abi(name, abi)
+        for name, blob in MINIMAL_ABIS_BYTES.items():
+            self.save_abi_bytes(name, blob)
 
         # Fetch full ABIs if requested
         if fetch_full and self.ETHERSCAN_API_KEY:
             print("\n🌐 Fetching full ABIs from Etherscan...")
-            for category, contracts in self.CONTRACTS.items():
-                print(f"\n📂 Category: {category}")
-                for name, address in contracts.items():
-                    print(f"⏳ Fetching {name}...")
-                    abi = self.fetch_abi_from_etherscan(address, network)
-                    if abi:
-                        self.save_abi(f"{name}_full", abi)
-                    time.sleep(0.2)  # Rate limiting
+            asyncio.run(self.fetch_full_abis(network, force))
 
         print("\n✨ ABI generation complete!")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate minimal and full contract ABIs.")
+    parser.add_argument(
+        "--network",
+        default="mainnet",
+        choices=("mainnet", "goerli", "sepolia"),
+        help="Etherscan network to fetch from (default: mainnet)",
+    )
+    parser.add_argument(
+        "--no-fetch-full",
+        dest="fetch_full",
+        action="store_false",
+        help="Only write the built-in minimal ABIs, skip Etherscan",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the local ABI cache and re-fetch everything from Etherscan",
+    )
+    args = parser.parse_args()
+
     # Initialize generator
     generator = ABIGenerator()
 
-    # Parse command line arguments (you could add argparse here)
-    fetch_full = True
-    network = "mainnet"
-
     # Generate ABIs
-    generator.generate_abis(fetch_full=fetch_full, network=network)
+    generator.generate_abis(fetch_full=args.fetch_full, network=args.network, force=args.force)
 
 
 if __name__ == "__main__":
@@ -5,13 +5,26 @@ This script allows you to load a JSON configuration file, inject a new command,
 and save the updated configuration back to the file.
 """
 
+import argparse
 import json
+import math
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['load_config', 'save_config', 'inject_command', 'has_lossy_floats']
+
+DEFAULT_CONFIG_FILE = r"PATH/TO/CONFIG/FILE"
 
 def load_config(file_path):
     """Load JSON configuration from a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        # configs are tiny, and the stdlib keeps NaN/Infinity and >64-bit integers intact
+        return json.loads(Path(file_path).read_bytes())
     except FileNotFoundError:
         print(f"Error: The file {file_path} does not exist.")
         return {}
@@ -19,19 +32,71 @@ def load_config(file_path):
         print(f"Error: The file {file_path} is not a valid JSON.")
         return {}
 
+def has_lossy_floats(obj):
+    """Check whether a JSON value holds floats orjson mishandles: NaN/Infinity, which it
+    writes as null, or integral values outside the 64-bit range, which it may have
+    parsed from an integer literal."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float) and (
+            not math.isfinite(value) or (value.is_integer() and not -2**63 <= value < 2**64)
+        ):
+            return True
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
+
 def save_config(file_path, config):
     """Save JSON configuration to a file."""
-    with open(file_path, 'w', encoding='utf-8') as file:
-        json.dump(config, file, indent=4)
+    data = None
+    if orjson is not None and not has_lossy_floats(config):
+        try:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib writes exactly
+            pass
+    if data is None:
+        data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    # write beside the target and swap it in, so a crash can't leave a truncated file
+    path = Path(file_path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
 def inject_command(config, command_key, command_value):
     """Inject a command into the configuration JSON."""
     config[command_key] = command_value
     return config
 
+def parse_assignment(text):
+    """Split a KEY=VALUE command line argument into a (key, value) pair."""
+    key, sep, value = text.partition('=')
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    return key, value
+
 def main():
     """Main function to load, inject, and save JSON configuration."""
-    config_file = r"PATH/TO/CONFIG/FILE"
+    parser = argparse.ArgumentParser(description="Inject keys into a JSON configuration file.")
+    parser.add_argument(
+        "--file",
+        default=DEFAULT_CONFIG_FILE,
+        help="path to the JSON configuration file",
+    )
+    parser.add_argument(
+        "--set",
+        dest="assignments",
+        action="append",
+        default=[],
+        type=parse_assignment,
+        metavar="KEY=VALUE",
+        help="configuration key to inject; repeat to inject several in one run",
+    )
+    args = parser.parse_args()
+    config_file = args.file
 
     # load the current configuration
     config = load_config(config_file)
@@ -40,19 +105,16 @@ def main():
     print("Current Configuration:")
     print(json.dumps(config, indent=4))
 
-    if command_key := input(
-        "Enter the configuration key to inject (leave blank to skip): "
-    ):
-        command_value = input("Enter the value for the configuration key: ")
+    if not args.assignments:
+        print("No key provided, skipping injection.")
+        return
 
-        # inject the command
+    # inject every command, then save the updated configuration back once
+    for command_key, command_value in args.assignments:
         config = inject_command(config, command_key, command_value)
-
-        # save the updated configuration back to the file
-        save_config(config_file, config)
+    save_config(config_file, config)
+    for command_key, command_value in args.assignments:
         print(f"Injected command: {command_key} = {command_value} into {config_file}")
-    else:
-        print("No key provided, skipping injection.")
 
 if __name__ == "__main__":
     main()
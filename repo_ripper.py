@@ -1,30 +1,390 @@
 import argparse
 import os
+import re
+import shelve
 import shutil
 import subprocess
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # config
 TARGET_ORG_NAME = "paradigmxyz"
 DEFAULT_BASE_DIR = "submodules"
 DEFAULT_ORG_DIR = None
+PER_PAGE = 100
+MAX_PAGE_WORKERS = 8
+MAX_CLONE_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+README_MAX_DEPTH = 2
+README_NAMES = {"readme.md", "readme.markdown"}
+README_SKIP_DIRS = {"node_modules", "target", "dist", "build"}
+# shallow, blobless clone of the default branch; history isn't needed for docs
+SHALLOW_CLONE_ARGS = ["--depth", "1", "--filter=blob:none", "--single-branch"]
+# abort transfers that stall below 1 KB/s for 30s instead of hanging a worker forever;
+# set with --config so later fetches in the same checkout keep it
+LOW_SPEED_ARGS = ["--config", "http.lowSpeedLimit=1000", "--config", "http.lowSpeedTime=30"]
+SUBMODULE_JOBS = 8
+# owner/name, optionally as @owner/name or a github.com URL with or without .git
+REPO_REF_RE = re.compile(
+    r"(?:@|(?:https?://)?github\.com/)?(?P<slug>[\w.-]+/[\w.-]+?)(?:\.git)?/?", re.ASCII
+)
+REPO_FIELDS = ("name", "full_name", "clone_url")
+REPO_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "repo_ripper", "listings")
 
 
 def find_readme(repo_path):
     """
     searches for a README file in the given repository path, case-insensitive.
+    checks the repo root first, then up to README_MAX_DEPTH levels below it,
+    skipping hidden (.git, .github, ...) and build directories.
     returns the path to the README file if found, otherwise None.
     """
-    for root, dirs, files in os.walk(repo_path):
-        for file in files:
-            if file.lower() == "readme.md":
-                return os.path.join(root, file)
+    pending = deque([(repo_path, 0)])
+    while pending:
+        current_dir, depth = pending.popleft()
+        try:
+            with os.scandir(current_dir) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.name.lower() in README_NAMES and entry.is_file():
+                        return entry.path
+                    if (
+                        depth < README_MAX_DEPTH
+                        and not entry.name.startswith(".")
+                        and entry.name not in README_SKIP_DIRS
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        pending.extend((subdir, depth + 1) for subdir in sorted(subdirs))
     return None
 
 
-def clone_organization_repos(org_name, base_dir, org_dir, repos_file=None):
+def create_session():
+    """
+    builds a keep-alive session shared by all GitHub API requests.
+    rate limits and transient 5xx responses are retried with exponential backoff,
+    and GITHUB_TOKEN is sent when set for the higher authenticated rate limit.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CLONE_WORKERS, max_retries=retry))
+    session.headers.update({"Accept": "application/vnd.github+json"})
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+def fetch_page(session, api_url, page, cached=None):
+    """
+    fetches one page of a repo listing. cached is the (etag, repos) pair saved for
+    this page on a previous run; a 304 Not Modified reply reuses its repos.
+    returns the response and the page's (etag, repos).
+    """
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+    response = session.get(
+        api_url, params={"page": page, "per_page": PER_PAGE}, headers=headers, timeout=30
+    )
+    if response.status_code == 304:
+        return response, cached
+    if response.status_code != 200:
+        print(f"Error fetching repositories: {response.status_code}")
+        sys.exit(1)
+    # listing entries carry ~100 fields, keep only the ones used so the cache stays small
+    repos = [{field: repo[field] for field in REPO_FIELDS} for repo in response.json()]
+    return response, (response.headers.get("ETag"), repos)
+
+
+def fetch_repositories(session, api_url, use_cache=True):
+    """
+    fetches every page of a repo listing. the first response's Link rel="last" header
+    gives the page count, so the remaining pages are requested concurrently.
+    pages are cached with their ETag under REPO_CACHE_PATH, so unchanged pages come
+    back as bodiless 304s on later runs.
+    """
+    os.makedirs(os.path.dirname(REPO_CACHE_PATH), exist_ok=True)
+    with shelve.open(REPO_CACHE_PATH) as cache:
+        cached_pages = cache.get(api_url, {}) if use_cache else {}
+
+    response, first = fetch_page(session, api_url, 1, cached_pages.get(1))
+    pages = {1: first}
+
+    last = response.links.get("last")
+    if last:
+        last_page = int(parse_qs(urlparse(last["url"]).query)["page"][0])
+    else:
+        # 304 replies may omit the Link header, fall back to last run's page count
+        last_page = max(cached_pages, default=1) if response.status_code == 304 else 1
+    if last_page > 1:
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            results = executor.map(
+                lambda page: fetch_page(session, api_url, page, cached_pages.get(page))[1],
+                range(2, last_page + 1),
+            )
+            pages.update(zip(range(2, last_page + 1), results))
+
+    # without a Link header a full last page means the listing may have grown
+    while not last and len(pages[last_page][1]) == PER_PAGE:
+        last_page += 1
+        pages[last_page] = fetch_page(session, api_url, last_page)[1]
+
+    with shelve.open(REPO_CACHE_PATH) as cache:
+        cache[api_url] = pages
+
+    all_repos = []
+    for page in range(1, last_page + 1):
+        all_repos.extend(pages[page][1])
+    return all_repos
+
+
+def is_git_checkout(repo_path):
+    return os.path.isdir(os.path.join(repo_path, ".git"))
+
+
+def clone_options(full_history=False, submodules=False):
+    """
+    builds the git clone flags shared by the git and gh clone paths.
+    """
+    options = list(LOW_SPEED_ARGS)
+    if not full_history:
+        options += SHALLOW_CLONE_ARGS
+    if submodules:
+        # fetch submodules in parallel rather than one after another
+        options += ["--recurse-submodules", "--jobs", str(SUBMODULE_JOBS)]
+        if not full_history:
+            options.append("--shallow-submodules")
+    return options
+
+
+def fetch_command(repo_path, full_history=False):
+    depth = [] if full_history else ["--depth", "1"]
+    return ["git", "-C", repo_path, "fetch", *depth, "origin", "HEAD"]
+
+
+def remove_docs_entry(readme_dest):
+    """
+    removes a previous run's docs/ README before it is rewritten. copy_readme
+    hardlinks into the checkout, so writing through an old entry would overwrite the
+    clone's tracked README, and os.link would collide with it.
+    """
+    try:
+        os.unlink(readme_dest)
+    except FileNotFoundError:
+        pass
+
+
+def copy_readme(repo_name, repo_path, docs_dir):
+    """
+    copies the repo's README into docs_dir as <repo_name>_README.md.
+    docs_dir must already exist.
+    """
+    readme_src = find_readme(repo_path)
+
+    if readme_src:
+        # work on the resolved file: a README symlinked outside the repo (e.g. to ~/.bashrc)
+        # must not be linked or copied, and os.link would otherwise link the symlink itself
+        readme_src = os.path.realpath(readme_src)
+        if not is_within(readme_src, os.path.realpath(repo_path)):
+            print(f"README.md in {repo_name} points outside the repository. Skipping.")
+            return
+
+        # create a unique filename for the README
+        repo_readme_name = f"{repo_name}_README.md"
+        readme_dest = os.path.join(docs_dir, repo_readme_name)
+        # hardlink when docs/ shares the checkout's filesystem, there's nothing to copy
+        remove_docs_entry(readme_dest)
+        try:
+            os.link(readme_src, readme_dest)
+        except OSError:
+            shutil.copyfile(readme_src, readme_dest)
+        print(f"README.md from {repo_name} copied to docs/{repo_readme_name}")
+    else:
+        print(f"No README.md found for {repo_name}.")
+
+
+def export_readme(repo_name, repo_path, rev, docs_dir):
+    """
+    writes the root README at rev straight from the object store with git cat-file,
+    so a fetched repo's docs match the new commit without touching its checkout.
+    returns False if rev has no root README or git can't read it.
+    """
+    listing = subprocess.run(
+        ["git", "-C", repo_path, "ls-tree", "--name-only", rev],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    readme = next((n for n in listing.stdout.splitlines() if n.lower() in README_NAMES), None)
+    if listing.returncode or readme is None:
+        return False
+
+    repo_readme_name = f"{repo_name}_README.md"
+    readme_dest = os.path.join(docs_dir, repo_readme_name)
+    remove_docs_entry(readme_dest)
+    with open(readme_dest, "wb") as readme_file:
+        result = subprocess.run(
+            ["git", "-C", repo_path, "cat-file", "blob", f"{rev}:{readme}"],
+            stdout=readme_file,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    if result.returncode:
+        os.unlink(readme_dest)
+        return False
+    print(f"README.md from {repo_name} ({rev}) written to docs/{repo_readme_name}")
+    return True
+
+
+def run_quiet(command, cwd=None):
+    """
+    runs a git/gh command with its output held back, since parallel clones would
+    interleave their progress lines. stderr goes to a temp file rather than a pipe so
+    memory stays flat and a chatty child can't block on a full pipe; it is only
+    printed if the command fails. returns True on success.
+    """
+    with tempfile.TemporaryFile() as stderr:
+        returncode = subprocess.run(
+            command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=stderr, check=False
+        ).returncode
+        if returncode:
+            stderr.seek(0)
+            sys.stderr.write(stderr.read().decode(errors="replace"))
+    return returncode == 0
+
+
+def clone_and_process_repo(
+    repo_name, repo_url, org_path, docs_dir, full_history=False, submodules=False
+):
+    # path to the cloned repo
+    repo_path = os.path.join(org_path, repo_name)
+
+    if is_git_checkout(repo_path):
+        # re-runs only refresh what is already there instead of failing on the clone
+        if run_quiet(fetch_command(repo_path, full_history)):
+            print(f"{repo_name} already present, fetched.")
+            if export_readme(repo_name, repo_path, "FETCH_HEAD", docs_dir):
+                return True
+        else:
+            print(f"Failed to fetch {repo_name}. Using the existing checkout.")
+    else:
+        print(f"Cloning {repo_name}...")
+
+        clone_args = clone_options(full_history, submodules)
+        if not run_quiet(["git", "clone", *clone_args, repo_url], cwd=org_path):
+            print(f"Failed to clone {repo_name}. Skipping.")
+            return False
+
+    copy_readme(repo_name, repo_path, docs_dir)
+    return True
+
+
+def download_readme(session, full_name, repo_name, docs_dir):
+    """
+    fetches the default branch README through the GitHub contents API, skipping the
+    clone entirely. the raw media type returns the file body instead of base64 JSON.
+    """
+    url = f"https://api.github.com/repos/{full_name}/readme"
+    try:
+        response = session.get(url, headers={"Accept": "application/vnd.github.raw"}, timeout=30)
+    except requests.RequestException as e:
+        print(f"Failed to fetch README.md for {repo_name}: {e}")
+        return
+    if response.status_code == 404:
+        print(f"No README.md found for {repo_name}.")
+        return
+    if response.status_code != 200:
+        # rate limits and bad tokens land here, so don't mistake them for a missing file
+        print(f"Failed to fetch README.md for {repo_name}: HTTP {response.status_code}")
+        return
+
+    repo_readme_name = f"{repo_name}_README.md"
+    readme_dest = os.path.join(docs_dir, repo_readme_name)
+    remove_docs_entry(readme_dest)
+    with open(readme_dest, "wb") as readme_file:
+        readme_file.write(response.content)
+    print(f"README.md from {repo_name} saved to docs/{repo_readme_name}")
+
+
+def is_within(path, root):
+    """
+    true if the absolute path is root itself or somewhere below it. compares whole
+    path components, so siblings like /foo/barbaz don't pass for root /foo/bar.
+    """
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:
+        # different drives on windows
+        return False
+
+
+def resolve_selection(all_repos, selection=None):
+    """
+    turns a selection into 0-based repo indices. selection is "all" or a string of
+    comma-separated 1-based numbers; when it is None the user is asked, unless stdin
+    isn't a terminal, in which case everything is selected so pipelines never block.
+    returns None if the selection can't be parsed.
+    """
+    if selection is None:
+        if not sys.stdin.isatty():
+            return range(len(all_repos))
+
+        # ask user if they want to clone all repositories or select specific ones
+        clone_all = (
+            input(
+                "Press Enter to clone all repositories or type 'select' to choose specific ones: "
+            )
+            .strip()
+            .lower()
+        )
+        if clone_all == "":  # user pressed Enter
+            selection = "all"
+        elif clone_all == "select":
+            print("Available repositories:")
+            for i, repo in enumerate(all_repos):
+                print(f"{i + 1}: {repo['name']}")
+
+            selection = input(
+                "Enter the numbers of the repositories you want to clone (comma-separated): "
+            )
+        else:
+            print("Invalid input. Exiting.")
+            return None
+
+    if selection == "all":
+        return range(len(all_repos))
+    try:
+        return [int(i) - 1 for i in selection.split(",")]
+    except ValueError:
+        print("Invalid input. Please enter comma-separated numbers.")
+        return None
+
+
+def clone_organization_repos(
+    org_name,
+    base_dir,
+    org_dir,
+    repos_file=None,
+    readme_only=False,
+    max_workers=MAX_CLONE_WORKERS,
+    full_history=False,
+    use_cache=True,
+    selection=None,
+    submodules=False,
+):
     # use org_name as org_dir if not specified
     if org_dir is None:
         org_dir = org_name
@@ -33,20 +393,20 @@ def clone_organization_repos(org_name, base_dir, org_dir, repos_file=None):
     current_dir = os.getcwd()
 
     # create the base directory if it doesn't exist
-    base_path = os.path.join(current_dir, base_dir)
+    base_path = os.path.abspath(os.path.join(current_dir, base_dir))
 
     # ensure that base_path is within the current directory
-    if not os.path.abspath(base_path).startswith(current_dir):
+    if not is_within(base_path, current_dir):
         print("Error: Attempting to create directories outside of the current directory.")
         sys.exit(1)
 
     os.makedirs(base_path, exist_ok=True)
 
     # create the organization directory within base_dir
-    org_path = os.path.join(base_path, org_dir)
+    org_path = os.path.abspath(os.path.join(base_path, org_dir))
 
     # ensure that org_path is within the current directory
-    if not os.path.abspath(org_path).startswith(current_dir):
+    if not is_within(org_path, current_dir):
         print("Error: Attempting to create directories outside of the current directory.")
         sys.exit(1)
 
@@ -58,131 +418,154 @@ def clone_organization_repos(org_name, base_dir, org_dir, repos_file=None):
     else:
         os.makedirs(org_path, exist_ok=True)
 
-    os.chdir(org_path)
+    # ensure 'docs' directory exists
+    docs_dir = os.path.join(current_dir, "docs")
+    os.makedirs(docs_dir, exist_ok=True)
 
     if repos_file:
         # clone repos from the provided file
-        clone_repos_from_file(repos_file, org_path)
+        clone_repos_from_file(repos_file, org_path, docs_dir, max_workers, full_history, submodules)
     else:
         # gitHub API URL for listing organization repositories
         api_url = f"https://api.github.com/orgs/{org_name}/repos"
 
         # fetch repositories (paginated)
-        page = 1
-        all_repos = []  # store all repositories for user selection
-        while True:
-            response = requests.get(f"{api_url}?page={page}&per_page=100")
-            if response.status_code != 200:
-                print(f"Error fetching repositories: {response.status_code}")
-                sys.exit(1)
-
-            repos = response.json()
-            if not repos:
-                break  # mo more repositories to fetch
-
-            all_repos.extend(repos)  # add fetched repos to the list
-            page += 1
-
-        # ask user if they want to clone all repositories or select specific ones
-        clone_all = (
-            input(
-                "Press Enter to clone all repositories or type 'select' to choose specific ones: "
-            )
-            .strip()
-            .lower()
-        )
+        with create_session() as session:
+            all_repos = fetch_repositories(session, api_url, use_cache)
 
-        if clone_all == "":  # user pressed Enter
-            selected_indices = range(len(all_repos))  # select all repositories
-        elif clone_all == "select":
-            print("Available repositories:")
-            for i, repo in enumerate(all_repos):
-                print(f"{i + 1}: {repo['name']}")
-
-            selected_indices_input = input(
-                "Enter the numbers of the repositories you want to clone (comma-separated): "
-            )
-            try:
-                selected_indices = [int(i) - 1 for i in selected_indices_input.split(",")]
-            except ValueError:
-                print("Invalid input. Please enter comma-separated numbers.")
-                return
-        else:
-            print("Invalid input. Exiting.")
+        selected_indices = resolve_selection(all_repos, selection)
+        if selected_indices is None:
             return
 
-        # ensure 'docs' directory exists
-        docs_dir = os.path.join(current_dir, "docs")
-        os.makedirs(docs_dir, exist_ok=True)
-
+        selected_repos = []
         for index in selected_indices:
             if index < 0 or index >= len(all_repos):
                 print(f"Index {index + 1} is out of range. Skipping.")
                 continue
+            selected_repos.append(all_repos[index])
+
+        if readme_only:
+            # only the docs are wanted, so grab the README files without cloning
+            with (
+                create_session() as session,
+                ThreadPoolExecutor(max_workers=max_workers) as executor,
+            ):
+                list(
+                    executor.map(
+                        lambda repo: download_readme(
+                            session, repo["full_name"], repo["name"], docs_dir
+                        ),
+                        selected_repos,
+                    )
+                )
+            print(f"READMEs of the selected repositories have been saved into {docs_dir}/")
+            return
 
-            repo = all_repos[index]
-            repo_name = repo["name"]
-            repo_url = repo["clone_url"]
-            print(f"Cloning {repo_name}...")
-
-            # clone the repository
-            subprocess.run(["git", "clone", repo_url])
-
-            # path to the cloned repo
-            repo_path = os.path.join(org_path, repo_name)
-
-            # find the README.md file
-            readme_src = find_readme(repo_path)
-
-            if readme_src:
-                # create a unique filename for the README
-                repo_readme_name = f"{repo_name}_README.md"
-                readme_dest = os.path.join(docs_dir, repo_readme_name)
-                shutil.copy(readme_src, readme_dest)
-                print(f"README.md from {repo_name} copied to docs/{repo_readme_name}")
-            else:
-                print(f"No README.md found for {repo_name}.")
+        # clones are network bound, so run several at once
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda repo: clone_and_process_repo(
+                        repo["name"],
+                        repo["clone_url"],
+                        org_path,
+                        docs_dir,
+                        full_history,
+                        submodules,
+                    ),
+                    selected_repos,
+                )
+            )
+        failed = results.count(False)
+        if failed:
+            print(f"{failed} of {len(results)} repositories failed to clone.")
 
     print(f"Selected repositories have been cloned into {org_path}/")
 
 
-def clone_repos_from_file(repos_file, org_path):
+def clone_repos_from_file(
+    repos_file,
+    org_path,
+    docs_dir,
+    max_workers=MAX_CLONE_WORKERS,
+    full_history=False,
+    submodules=False,
+):
+    # keyed on the clone directory, since two refs sharing a name (e.g. forks) would race
+    # two clones into one directory
+    refs_by_dir = {}
     with open(repos_file, "r") as file:
         for line in file:
-            # strip and split the line to get the repo reference
-            repo_ref = line.strip().split()[-1]
-
-            # convert full URLs to GitHub CLI format
-            if repo_ref.startswith("https://github.com/"):
-                repo_ref = repo_ref.replace("https://github.com/", "")
-                if repo_ref.endswith(".git"):
-                    repo_ref = repo_ref[:-4]
-
-            # remove @ symbol if present
-            if repo_ref.startswith("@"):
-                repo_ref = repo_ref[1:]
-
-            # construct the gh cli command
-            command = ["gh", "repo", "clone", repo_ref]
-
-            repo_name = repo_ref.split("/")[-1]
+            # the repo reference is the last word, e.g. of a "gh repo clone owner/name" line
+            words = line.split()
+            if not words or words[0].startswith("#"):
+                continue
+            match = REPO_REF_RE.fullmatch(words[-1])
+            if match is None:
+                print(f"unrecognised repo reference {words[-1]!r}. skipping.")
+                continue
+            repo_ref = match["slug"]
+            repo_dir = repo_ref.split("/")[-1].lower()
+            kept = refs_by_dir.setdefault(repo_dir, repo_ref)
+            if kept.lower() != repo_ref.lower():
+                print(f"{repo_ref} would clone into the same directory as {kept}. skipping.")
+    repo_refs = list(refs_by_dir.values())
+
+    # keep up to max_workers gh clones in flight; they mostly wait on the network
+    inflight = deque()
+    cloned = []
+    fetched = set()
+    failed = []
+
+    def reap_oldest():
+        repo_name, process, stderr = inflight.popleft()
+        with stderr:
+            if process.wait() == 0:
+                cloned.append(repo_name)
+                return
+            stderr.seek(0)
+            sys.stderr.write(stderr.read().decode(errors="replace"))
+        if repo_name in fetched:
+            # a failed refresh still leaves a usable checkout, same as the org path
+            print(f"failed to fetch {repo_name}. using the existing checkout.")
+            fetched.discard(repo_name)
+            cloned.append(repo_name)
+        else:
+            print(f"failed to clone {repo_name}. skipping.")
+            failed.append(repo_name)
+
+    for repo_ref in repo_refs:
+        repo_name = repo_ref.split("/")[-1]
+        repo_path = os.path.join(org_path, repo_name)
+        if is_git_checkout(repo_path):
+            # already cloned on a previous run, just refresh it
+            print(f"{repo_name} already present, fetching...")
+            command = fetch_command(repo_path, full_history)
+            fetched.add(repo_name)
+        else:
             print(f"cloning {repo_name}...")
-
-            # execute the gh cli command
-            subprocess.run(command, cwd=org_path)
-
-            # find and copy README
-            repo_path = os.path.join(org_path, repo_name)
-            readme_src = find_readme(repo_path)
-            if readme_src:
-                docs_dir = os.path.join(os.getcwd(), "docs")
-                os.makedirs(docs_dir, exist_ok=True)
-                repo_readme_name = f"{repo_name}_README.md"
-                readme_dest = os.path.join(docs_dir, repo_readme_name)
-                shutil.copy(readme_src, readme_dest)
-                print(f"README.md from {repo_name} copied to docs/{repo_readme_name}")
-            else:
-                print(f"no README.md found for {repo_name}. bummer!")
+            # everything after "--" is passed through to git clone
+            command = ["gh", "repo", "clone", repo_ref, "--"]
+            command += clone_options(full_history, submodules)
+
+        # execute the gh cli command
+        if len(inflight) >= max_workers:
+            reap_oldest()
+        # output is held back like run_quiet, so parallel clones don't interleave
+        stderr = tempfile.TemporaryFile()  # noqa: SIM115 - closed in reap_oldest
+        process = subprocess.Popen(command, cwd=org_path, stdout=subprocess.DEVNULL, stderr=stderr)
+        inflight.append((repo_name, process, stderr))
+    while inflight:
+        reap_oldest()
+    if failed:
+        print(f"{len(failed)} of {len(repo_refs)} repositories failed to clone.")
+
+    # find and copy READMEs; local and quick, so done in a second sequential pass
+    for repo_name in cloned:
+        repo_path = os.path.join(org_path, repo_name)
+        if repo_name in fetched and export_readme(repo_name, repo_path, "FETCH_HEAD", docs_dir):
+            continue
+        copy_readme(repo_name, repo_path, docs_dir)
 
 
 if __name__ == "__main__":
@@ -200,6 +583,62 @@ if __name__ == "__main__":
         "--repos-file",
         help="Path to a file containing specific gh repo clone commands",
     )
+    parser.add_argument(
+        "--readme-only",
+        action="store_true",
+        help="Only download each org repository's README.md into docs/ instead of cloning",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=MAX_CLONE_WORKERS,
+        help=f"Number of clones or downloads to run at once (default: {MAX_CLONE_WORKERS})",
+    )
+    parser.add_argument(
+        "--full-history",
+        action="store_true",
+        help="Clone full history instead of a shallow, blobless clone",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Ignore the cached repository listing and download every page again",
+    )
+    parser.add_argument(
+        "--submodules",
+        action="store_true",
+        help=f"Also clone submodules, {SUBMODULE_JOBS} at a time",
+    )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--all",
+        dest="selection",
+        action="store_const",
+        const="all",
+        help="Clone every repository in the org without prompting",
+    )
+    selection.add_argument(
+        "--repos",
+        dest="selection",
+        metavar="N,N,...",
+        help="Comma-separated numbers (1-based, in listing order) of repositories to clone",
+    )
     args = parser.parse_args()
-
-    clone_organization_repos(args.org, args.base_dir, args.org_dir, args.repos_file)
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    if args.readme_only and args.repos_file:
+        parser.error("--readme-only only applies to org listings, not --repos-file")
+
+    clone_organization_repos(
+        args.org,
+        args.base_dir,
+        args.org_dir,
+        args.repos_file,
+        args.readme_only,
+        args.max_workers,
+        args.full_history,
+        args.use_cache,
+        args.selection,
+        args.submodules,
+    )
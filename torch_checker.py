@@ -1,7 +1,12 @@
+import glob
 import os
+import re
+import sys
 
 import torch
 
+GPU_ENV_RE = re.compile("cuda|gpu|nvidia", re.IGNORECASE)
+
 print(f"PyTorch version: {torch.__version__}")
 print(f"CUDA available: {torch.cuda.is_available()}")
 print(f"CUDA version: {torch.version.cuda}")
@@ -12,7 +17,7 @@ if torch.cuda.is_available():
 
 print("\nEnvironment variables:")
 for key, value in os.environ.items():
-    if "cuda" in key.lower() or "gpu" in key.lower() or "nvidia" in key.lower():
+    if GPU_ENV_RE.search(key):
         print(f"{key}: {value}")
 
 print("\nCUDA library path:")
@@ -21,18 +26,21 @@ try:
 except:
     print("CUDA_HOME not found")
 
-if not torch.cuda.is_available():
-    print("\nChecking CUDA libraries:")
-    try:
-        import ctypes
-
-        ctypes.CDLL("nvcuda.dll")
-        print("nvcuda.dll loaded successfully")
-    except:
-        print("Failed to load nvcuda.dll")
+# the driver/runtime DLL probes only mean something on windows
+if not torch.cuda.is_available() and sys.platform == "win32":
+    import ctypes
 
-    try:
-        ctypes.CDLL("cudart64_110.dll")
-        print("cudart64_110.dll loaded successfully")
-    except:
-        print("Failed to load cudart64_110.dll")
+    print("\nChecking CUDA libraries:")
+    cudart = []
+    cuda_path = os.environ.get("CUDA_PATH")
+    if cuda_path:
+        # the runtime DLL is versioned (cudart64_110.dll, cudart64_12.dll, ...), take the newest
+        cudart = sorted(glob.glob(os.path.join(cuda_path, "bin", "cudart64_*.dll")))[-1:]
+    if not cudart:
+        print(f"No cudart64_*.dll found under CUDA_PATH ({cuda_path or 'not set'})")
+    for dll in ["nvcuda.dll", *cudart]:
+        try:
+            ctypes.CDLL(dll)
+            print(f"{os.path.basename(dll)} loaded successfully")
+        except OSError as e:
+            print(f"Failed to load {os.path.basename(dll)}: {e}")